@@ -9,7 +9,7 @@ from discord import app_commands, Embed
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from utils.logger import Logger
 from utils.config import Config
 from utils.data_processing import Text
@@ -20,6 +20,8 @@ from math import ceil
 
 
 class GovernanceMonitor(discord.Client):
+    TRAILING_WORD_PATTERN = re.compile(r'\s+\S+$')
+
     def __init__(self, guild, discord_role, permission_checker, intents):
         super().__init__(intents=intents)
         self.button_cooldowns = {}
@@ -85,7 +87,8 @@ class GovernanceMonitor(discord.Client):
 
     async def check_permissions(self, interaction, required_role, user_id, user_roles):
         self.logger.info(f"Checking {interaction.user.name} has the appropriate permissions")
-        if required_role and not any(role.name == required_role for role in user_roles):
+        has_required_role = any(role.name == required_role for role in user_roles)
+        if required_role and not has_required_role:
             self.logger.warning(f"<@{user_id}> doesn't have the necessary role assigned to participate: {required_role}")
             interaction_message = await interaction.followup.send(
                 f"You have insufficient access to execute this command! Required role: `{required_role}`.",
@@ -93,7 +96,7 @@ class GovernanceMonitor(discord.Client):
             await asyncio.sleep(10)
             await interaction_message.delete()
             return False
-        elif any(role.name == required_role for role in user_roles):
+        elif has_required_role:
             self.logger.info(f"User has sufficient access")
             return True
 
@@ -517,7 +520,7 @@ class GovernanceMonitor(discord.Client):
                 self.button_cooldowns[user_id] = current_time
                 vote_type = "aye" if custom_id == "aye_button" else "recuse" if custom_id == "recuse_button" else "nay"
                 # Save or update vote in the database
-                if message_id not in list(self.vote_counts.keys()):
+                if message_id not in self.vote_counts:
                     # If the thread gets created but the data isn't available in vote_counts.json
                     # then create it.
                     origin_tag = discord_thread.applied_tags[0].name
@@ -603,7 +606,7 @@ class GovernanceMonitor(discord.Client):
             final_content = content or ''
             if len(final_content) > self.config.DISCORD_BODY_MAX_LENGTH:
                 available_space = self.config.DISCORD_BODY_MAX_LENGTH - len(char_exceed_msg + "...")
-                truncated_content = re.sub(r'\s+\S+$', '', final_content[:available_space])
+                truncated_content = self.TRAILING_WORD_PATTERN.sub('', final_content[:available_space])
                 final_content = f"{truncated_content}...{char_exceed_msg}"
 
             thread_content = f"{final_content}\n\n"
@@ -775,7 +778,7 @@ class GovernanceMonitor(discord.Client):
         except Exception as e:
             self.logger.error(f"An error occurred while locking threads: {str(e)}")
 
-    async def calculate_proxy_vote(self, aye_votes: int, nay_votes: int, recuse_votes: int, threshold: float = 0.66) -> str:
+    async def calculate_proxy_vote(self, aye_votes: int, nay_votes: int, recuse_votes: int, threshold: float = 0.66, total_members: Optional[int] = None) -> str:
         """ Calculate and return the result of a vote based on 'aye' and 'nay' counts. """
         total_votes = aye_votes + nay_votes
 
@@ -785,7 +788,8 @@ class GovernanceMonitor(discord.Client):
         # Default to abstain if the turnout internally is <= config.MIN_PARTICIPATION
         # Set to 0 to turn off this feature
         if self.config.MIN_PARTICIPATION > 0:
-            members_ids, total_members = await self.get_voting_members(guild=self.config.DISCORD_SERVER_ID, role_name=self.config.DISCORD_VOTER_ROLE)
+            if total_members is None:
+                members_ids, total_members = await self.get_voting_members(guild=self.config.DISCORD_SERVER_ID, role_name=self.config.DISCORD_VOTER_ROLE)
             participation = self.check_minimum_participation(total_members=total_members, total_vote_count=aye_votes + nay_votes + recuse_votes, min_participation=self.config.MIN_PARTICIPATION)
 
             if not participation['meets_minimum']:
@@ -805,7 +809,7 @@ class GovernanceMonitor(discord.Client):
         else:
             return "abstain"
 
-    async def determine_vote_action(self, thread_id: int, vote_data: Dict[str, Any], origin: Dict[str, Any], proposal_epoch: int):
+    async def determine_vote_action(self, thread_id: int, vote_data: Dict[str, Any], origin: Dict[str, Any], proposal_epoch: int, total_members: Optional[int] = None):
         """ Determine the appropriate vote action based on elapsed time since epoch and role periods. """
         SECONDS_IN_A_DAY = 86400
         current_time = int(time.time())
@@ -820,7 +824,8 @@ class GovernanceMonitor(discord.Client):
         _2nd_vote = proposal_elapsed_time >= cast_2nd_vote
 
         if proposal_elapsed_time < cast_1st_vote and self.config.MIN_PARTICIPATION > 0:
-            members_ids, total_members = await self.get_voting_members(guild=self.config.DISCORD_SERVER_ID, role_name=self.config.DISCORD_VOTER_ROLE)
+            if total_members is None:
+                members_ids, total_members = await self.get_voting_members(guild=self.config.DISCORD_SERVER_ID, role_name=self.config.DISCORD_VOTER_ROLE)
             total_votes = vote_data['aye'] + vote_data['nay'] + vote_data['recuse']
             participation = self.check_minimum_participation(total_members=total_members, total_vote_count=total_votes, min_participation=self.config.MIN_PARTICIPATION)
             one_day_before_voting = (cast_1st_vote - proposal_elapsed_time) <= SECONDS_IN_A_DAY
@@ -844,11 +849,11 @@ class GovernanceMonitor(discord.Client):
             return 0, "Vote period has ended."
 
         if _1st_vote and not _2nd_vote:
-            vote = await self.calculate_proxy_vote(aye_votes=vote_data['aye'], nay_votes=vote_data['nay'], recuse_votes=vote_data['recuse'])
+            vote = await self.calculate_proxy_vote(aye_votes=vote_data['aye'], nay_votes=vote_data['nay'], recuse_votes=vote_data['recuse'], total_members=total_members)
             return 1, vote
 
         if _1st_vote and _2nd_vote:
-            vote = await self.calculate_proxy_vote(aye_votes=vote_data['aye'], nay_votes=vote_data['nay'], recuse_votes=vote_data['recuse'])
+            vote = await self.calculate_proxy_vote(aye_votes=vote_data['aye'], nay_votes=vote_data['nay'], recuse_votes=vote_data['recuse'], total_members=total_members)
             return 2, vote
 
         if not _1st_vote:
@@ -247,7 +247,7 @@ async def autonomous_voting():
         await client.wait_until_ready()
         await task_handler.stop_tasks(coroutine_task=[sync_embeds, recheck_proposals])
         await client.disable_command(command_name='forcevote', guild_id=config.DISCORD_SERVER_ID)
-        await client.get_voting_members(guild=config.DISCORD_SERVER_ID, role_name=config.DISCORD_VOTER_ROLE, save_records=True)
+        _, total_voting_members = await client.get_voting_members(guild=config.DISCORD_SERVER_ID, role_name=config.DISCORD_VOTER_ROLE, save_records=True)
         vote_counts = await client.load_vote_counts()
         onchain_votes = await client.load_onchain_votes()
         onchain_votes_length = len(str(onchain_votes))
@@ -282,7 +282,7 @@ async def autonomous_voting():
                 proposal_block_epoch = await substrate.get_block_epoch(block_number=proposal_block_submitted)
                 logging.info(f"Checking ref: #{proposal_index}")
 
-                cast, vote_type = await client.determine_vote_action(thread_id=thread_id, vote_data=vote_data, origin=internal_vote_periods, proposal_epoch=proposal_block_epoch)
+                cast, vote_type = await client.determine_vote_action(thread_id=thread_id, vote_data=vote_data, origin=internal_vote_periods, proposal_epoch=proposal_block_epoch, total_members=total_voting_members)
                 logging.info(f"Result: {vote_type}")
 
                 # If the proposal already exists in the results, use the existing 1st_vote data
@@ -784,7 +784,6 @@ if __name__ == '__main__':
             user_id = interaction.user.id
 
             vote_counts = await client.load_vote_counts()
-            vote_count_channels = vote_counts.keys()
 
             member = await interaction.guild.fetch_member(user_id)
             roles = member.roles
@@ -802,12 +801,13 @@ if __name__ == '__main__':
                 await asyncio.sleep(0.5)
 
                 # Make sure the channel the command is running in is a channel with ongoing votes
-                if str(channel.id) in vote_count_channels:
-                    proposal_index = vote_counts.get(str(channel.id), {}).get('index', {})
-                    aye = vote_counts.get(str(channel.id), {}).get('aye', {})
-                    nay = vote_counts.get(str(channel.id), {}).get('nay', {})
-                    recuse = vote_counts.get(str(channel.id), {}).get('recuse', {})
-                    origin = vote_counts.get(str(channel.id), {}).get('origin', {})
+                proposal = vote_counts.get(str(channel.id))
+                if proposal is not None:
+                    proposal_index = proposal.get('index', {})
+                    aye = proposal.get('aye', {})
+                    nay = proposal.get('nay', {})
+                    recuse = proposal.get('recuse', {})
+                    origin = proposal.get('origin', {})
 
                     vote = await client.calculate_proxy_vote(aye_votes=aye, nay_votes=nay, recuse_votes=recuse)
                     role = await client.create_or_get_role(interaction.guild, config.EXTRINSIC_ALERT)
@@ -14,12 +14,6 @@ intents.message_content = True  # Necessary to access message content
 # Create a new discord bot client with intents
 client = discord.Client(intents=intents)
 
-# Load the .env file
-load_dotenv()
-
-# Get the DISCORD_TOKEN from the environment
-discord_token = os.getenv('DISCORD_TOKEN')
-
 class MaterializedChainState:
     def __init__(self, url="wss://rpc.ibp.network/polkadot"):
         try:
@@ -307,4 +301,10 @@ async def on_message(message):
         await message.channel.send(embed=embed_data, file=discord.File('../../assets/polkadot/polkadot.png', filename="symbol.png"))
 
 
-client.run(discord_token)
+if __name__ == "__main__":
+    # Load the .env file
+    load_dotenv()
+
+    # Get the DISCORD_TOKEN from the environment
+    discord_token = os.getenv('DISCORD_TOKEN')
+    client.run(discord_token)
@@ -6,17 +6,10 @@ import asyncio
 import discord
 from discord.ext import commands, tasks
 from discord.ext.tasks import Loop
-from asyncio import coroutine
 
 intents = discord.Intents.default()
 bot = commands.Bot(command_prefix="!", intents=intents)
 
-# Load the .env file
-load_dotenv()
-
-# Get the DISCORD_TOKEN from the environment
-discord_token = os.getenv('DISCORD_TOKEN')
-
 
 def get_timestamp():
     """Returns the current timestamp in a readable format."""
@@ -141,24 +134,29 @@ async def recheck_proposals():
         await asyncio.sleep(random.uniform(0.1, 5.0))
     print("\n")
 
-@autonomous_voting.before_loop
-async def before_voting():
-    autonomous_voting.get_task().set_name('autonomous_governance')
+
+TASKS = {
+    'check_governance': check_governance,
+    'autonomous_governance': autonomous_voting,
+    'sync_embeds': sync_embeds,
+    'recheck_proposals': recheck_proposals,
+}
 
 
-@check_governance.before_loop
-async def before_governance():
-    check_governance.get_task().set_name('check_governance')
+def set_name_before_loop(task: Loop, name: str):
+    """Registers a before_loop hook that names the task's underlying asyncio.Task."""
+    @task.before_loop
+    async def before_task():
+        task.get_task().set_name(name)
 
 
-@sync_embeds.before_loop
-async def before_sync_embeds():
-    sync_embeds.get_task().set_name('sync_embeds')
+def register_task_names():
+    """Attaches a naming before_loop hook to every task in TASKS."""
+    for task_name, task_loop in TASKS.items():
+        set_name_before_loop(task_loop, task_name)
 
 
-@recheck_proposals.before_loop
-async def before_recheck_proposals():
-    recheck_proposals.get_task().set_name('recheck_proposals')
+register_task_names()
 
 
 @bot.event
@@ -166,4 +164,11 @@ async def on_ready():
     print(f'Logged in as {bot.user}')
     await start_tasks([check_governance])
 
-bot.run(discord_token)
+
+if __name__ == "__main__":
+    # Load the .env file
+    load_dotenv()
+
+    # Get the DISCORD_TOKEN from the environment
+    discord_token = os.getenv('DISCORD_TOKEN')
+    bot.run(discord_token)
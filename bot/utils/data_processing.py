@@ -16,6 +16,10 @@ from utils.logger import Logger
 
 
 class Text:
+    LINK_PATTERN = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+    IMAGE_PATTERN = re.compile(r'!\[[^\]]*\]\(([^)]+)\)')
+    EXCESS_NEWLINES_PATTERN = re.compile(r'(?:\s*\n){3,}')
+
     @staticmethod
     def convert_markdown_to_discord(markdown_text):
         base_url = "https://polkadot.polkassembly.io/"
@@ -40,9 +44,9 @@ class Text:
         # This keeps URLs clean and prevents unwanted backslashes from appearing
         markdown_text = markdownify.markdownify(markdown_text, escape_underscores=False, escape_asterisks=False)
 
-        markdown_text = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', replacer_link, markdown_text)
-        markdown_text = re.sub(r'!\[[^\]]*\]\(([^)]+)\)', replacer_image, markdown_text)
-        markdown_text = re.sub(r'(?:\s*\n){3,}', '\n\n', markdown_text)  # Replace three or more newlines with optional spaces with just one newline
+        markdown_text = Text.LINK_PATTERN.sub(replacer_link, markdown_text)
+        markdown_text = Text.IMAGE_PATTERN.sub(replacer_image, markdown_text)
+        markdown_text = Text.EXCESS_NEWLINES_PATTERN.sub('\n\n', markdown_text)  # Replace three or more newlines with optional spaces with just one newline
         markdown_text = markdown_text.rstrip('\n')                                   # Remove trailing line breaks
 
         if len(markdown_text) == 0:
@@ -137,12 +137,11 @@ class DatabaseHandler:
 
             
             for user_id, user_data in data.get('users', {}).items():
-                # Debugging print
-                print(user_id, user_data.get('username'), user_data.get('vote_type'), thread_id)
+                self.logger.debug(f"Migrating vote: {user_id} {user_data.get('username')} {user_data.get('vote_type')} {thread_id}")
 
                 # Check for None values
                 if None in [user_id, user_data.get('username'), user_data.get('vote_type'), thread_id]:
-                    print("Skipping due to None value")
+                    self.logger.warning(f"Skipping vote from user {user_id} with missing data in thread {thread_id}")
                     continue
 
                 cursor.execute("""
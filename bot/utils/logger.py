@@ -145,6 +145,9 @@ class Logger:
         Args:
             message (str): The message to log.
         """
+        # Skip the stack inspection entirely when debug output is disabled
+        if not logging.getLogger().isEnabledFor(logging.DEBUG):
+            return
         caller_info = Logger.get_caller_info()
         Logger.log(logging.debug, caller_info, message)
 
@@ -12,14 +12,14 @@ def calculate_current_participation_rate(votes, members):
             'display_name': member_display_name
         }
     
-    for proposal_id, proposal_data in votes.items():
-            for user_id, user_data in proposal_data.get('users', {}).items():
+    for proposal_data in votes.values():
+            for user_data in proposal_data.get('users', {}).values():
                 username = user_data.get('username')[:-2]  # Remove last two characters
                 if username in members_votes:
                     members_votes[username]['votes'] += 1
     
     # Calculate participation rate for each member
-    for username, stats in members_votes.items():
+    for stats in members_votes.values():
         stats['participation_rate'] = (stats['votes'] / total_proposals * 100) if total_proposals > 0 else 0
     
     content = []